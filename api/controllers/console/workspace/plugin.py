@@ -272,9 +272,8 @@ class PluginUploadFromPkgApi(Resource):
         if file.content_length > dify_config.PLUGIN_MAX_PACKAGE_SIZE:
             raise ValueError("File size exceeds the maximum allowed size")
 
-        content = file.read()
         try:
-            response = PluginService.upload_pkg(tenant_id, content)
+            response = PluginService.upload_pkg(tenant_id, file.stream)
         except PluginDaemonClientSideError as e:
             raise ValueError(e)
 
@@ -316,9 +315,8 @@ class PluginUploadFromBundleApi(Resource):
         if file.content_length > dify_config.PLUGIN_MAX_BUNDLE_SIZE:
             raise ValueError("File size exceeds the maximum allowed size")
 
-        content = file.read()
         try:
-            response = PluginService.upload_bundle(tenant_id, content)
+            response = PluginService.upload_bundle(tenant_id, file.stream)
         except PluginDaemonClientSideError as e:
             raise ValueError(e)
 
@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from typing import IO
 
 from requests import HTTPError
 
@@ -76,11 +77,13 @@ class PluginInstaller(BasePluginClient):
     def upload_pkg(
         self,
         tenant_id: str,
-        pkg: bytes,
+        pkg: bytes | IO[bytes],
         verify_signature: bool = False,
     ) -> PluginDecodeResponse:
         """
         Upload a plugin package and return the plugin unique identifier.
+
+        `pkg` may be a binary file object, which is sent to the daemon in chunks.
         """
         body = {
             "dify_pkg": ("dify_pkg", pkg, "application/octet-stream"),
@@ -101,7 +104,7 @@ class PluginInstaller(BasePluginClient):
     def upload_bundle(
         self,
         tenant_id: str,
-        bundle: bytes,
+        bundle: bytes | IO[bytes],
         verify_signature: bool = False,
     ) -> Sequence[PluginBundleDependency]:
         """
@@ -37,6 +37,9 @@ class MCPToolProviderController(ToolProviderController):
         self.headers = headers or {}
         self.timeout = timeout
         self.sse_read_timeout = sse_read_timeout
+        self._tools_by_name: dict[str, ToolEntity] = {
+            tool_entity.identity.name: tool_entity for tool_entity in entity.tools
+        }
 
     @property
     def provider_type(self) -> ToolProviderType:
@@ -117,10 +120,7 @@ class MCPToolProviderController(ToolProviderController):
         """
         return tool with given name
         """
-        tool_entity = next(
-            (tool_entity for tool_entity in self.entity.tools if tool_entity.identity.name == tool_name), None
-        )
-
+        tool_entity = self._tools_by_name.get(tool_name)
         if not tool_entity:
             raise ValueError(f"Tool with name {tool_name} not found")
 
@@ -3,7 +3,7 @@ from typing import Any
 from core.plugin.impl.tool import PluginToolManager
 from core.tools.__base.tool_runtime import ToolRuntime
 from core.tools.builtin_tool.provider import BuiltinToolProviderController
-from core.tools.entities.tool_entities import ToolProviderEntityWithPlugin, ToolProviderType
+from core.tools.entities.tool_entities import ToolEntity, ToolProviderEntityWithPlugin, ToolProviderType
 from core.tools.errors import ToolProviderCredentialValidationError
 from core.tools.plugin_tool.tool import PluginTool
 
@@ -13,6 +13,7 @@ class PluginToolProviderController(BuiltinToolProviderController):
     tenant_id: str
     plugin_id: str
     plugin_unique_identifier: str
+    _tools_by_name: dict[str, ToolEntity]
 
     def __init__(
         self, entity: ToolProviderEntityWithPlugin, plugin_id: str, plugin_unique_identifier: str, tenant_id: str
@@ -21,6 +22,7 @@ class PluginToolProviderController(BuiltinToolProviderController):
         self.tenant_id = tenant_id
         self.plugin_id = plugin_id
         self.plugin_unique_identifier = plugin_unique_identifier
+        self._tools_by_name = {tool_entity.identity.name: tool_entity for tool_entity in entity.tools}
 
     @property
     def provider_type(self) -> ToolProviderType:
@@ -48,10 +50,7 @@ class PluginToolProviderController(BuiltinToolProviderController):
         """
         return tool with given name
         """
-        tool_entity = next(
-            (tool_entity for tool_entity in self.entity.tools if tool_entity.identity.name == tool_name), None
-        )
-
+        tool_entity = self._tools_by_name.get(tool_name)
         if not tool_entity:
             raise ValueError(f"Tool with name {tool_name} not found")
 
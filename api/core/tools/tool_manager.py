@@ -3,7 +3,7 @@ import logging
 import mimetypes
 import time
 from collections.abc import Generator, Mapping
-from os import listdir, path
+from os import path, scandir
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict, Union, cast
 
@@ -554,36 +554,29 @@ class ToolManager:
         """
         list all the builtin providers
         """
-        for provider_path in listdir(path.join(path.dirname(path.realpath(__file__)), "builtin_tool", "providers")):
-            if provider_path.startswith("__"):
-                continue
-
-            if path.isdir(path.join(path.dirname(path.realpath(__file__)), "builtin_tool", "providers", provider_path)):
-                if provider_path.startswith("__"):
-                    continue
-
-                # init provider
-                try:
-                    provider_class = load_single_subclass_from_source(
-                        module_name=f"core.tools.builtin_tool.providers.{provider_path}.{provider_path}",
-                        script_path=path.join(
-                            path.dirname(path.realpath(__file__)),
-                            "builtin_tool",
-                            "providers",
-                            provider_path,
-                            f"{provider_path}.py",
-                        ),
-                        parent_type=BuiltinToolProviderController,
-                    )
-                    provider: BuiltinToolProviderController = provider_class()
-                    cls._hardcoded_providers[provider.entity.identity.name] = provider
-                    for tool in provider.get_tools():
-                        cls._builtin_tools_labels[tool.entity.identity.name] = tool.entity.identity.label
-                    yield provider
+        providers_dir = path.join(path.dirname(path.realpath(__file__)), "builtin_tool", "providers")
+        # scandir reports entry types from the directory listing itself, so no per-entry stat is needed
+        with scandir(providers_dir) as entries:
+            provider_dirs = [entry for entry in entries if not entry.name.startswith("__") and entry.is_dir()]
+
+        for provider_dir in provider_dirs:
+            provider_path = provider_dir.name
+            # init provider
+            try:
+                provider_class = load_single_subclass_from_source(
+                    module_name=f"core.tools.builtin_tool.providers.{provider_path}.{provider_path}",
+                    script_path=path.join(provider_dir.path, f"{provider_path}.py"),
+                    parent_type=BuiltinToolProviderController,
+                )
+                provider: BuiltinToolProviderController = provider_class()
+                cls._hardcoded_providers[provider.entity.identity.name] = provider
+                for tool in provider.get_tools():
+                    cls._builtin_tools_labels[tool.entity.identity.name] = tool.entity.identity.label
+                yield provider
 
-                except Exception:
-                    logger.exception("load builtin provider %s", provider_path)
-                    continue
+            except Exception:
+                logger.exception("load builtin provider %s", provider_path)
+                continue
         # set builtin providers loaded
         cls._builtin_providers_loaded = True
 
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 import sqlalchemy as sa
 from deprecated import deprecated
+from pydantic import TypeAdapter
 from sqlalchemy import ForeignKey, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -21,6 +22,10 @@ from .types import LongText, StringUUID
 if TYPE_CHECKING:
     from core.entities.mcp_provider import MCPProviderEntity
 
+# Validating the whole stored JSON list in one call avoids a model_validate round trip per item
+_api_tool_bundles_adapter = TypeAdapter(list[ApiToolBundle])
+_workflow_tool_parameter_configurations_adapter = TypeAdapter(list[WorkflowToolParameterConfiguration])
+
 
 # system level tool oauth client params (client_id, client_secret, etc.)
 class ToolOAuthSystemClient(TypeBase):
@@ -172,7 +177,7 @@ class ApiToolProvider(TypeBase):
 
     @property
     def tools(self) -> list["ApiToolBundle"]:
-        return [ApiToolBundle.model_validate(tool) for tool in json.loads(self.tools_str)]
+        return _api_tool_bundles_adapter.validate_json(self.tools_str)
 
     @property
     def credentials(self) -> dict[str, Any]:
@@ -268,10 +273,7 @@ class WorkflowToolProvider(TypeBase):
 
     @property
     def parameter_configurations(self) -> list["WorkflowToolParameterConfiguration"]:
-        return [
-            WorkflowToolParameterConfiguration.model_validate(config)
-            for config in json.loads(self.parameter_configuration)
-        ]
+        return _workflow_tool_parameter_configurations_adapter.validate_json(self.parameter_configuration)
 
     @property
     def app(self) -> App | None:
@@ -20,6 +20,7 @@ from configs import dify_config
 from core.helper import ssrf_proxy
 from core.model_runtime.utils.encoders import jsonable_encoder
 from core.plugin.entities.plugin import PluginDependency
+from core.tools.utils.yaml_utils import safe_load_yaml
 from core.workflow.enums import NodeType
 from core.workflow.nodes.knowledge_retrieval.entities import KnowledgeRetrievalNodeData
 from core.workflow.nodes.llm.entities import LLMNodeData
@@ -189,12 +190,18 @@ class AppDslService:
                     status=ImportStatus.FAILED,
                     error="yaml_content is required when import_mode is yaml-content",
                 )
+            if len(yaml_content) > DSL_MAX_SIZE:
+                return Import(
+                    id=import_id,
+                    status=ImportStatus.FAILED,
+                    error="File size exceeds the limit of 10MB",
+                )
             content = yaml_content
 
         # Process YAML content
         try:
             # Parse YAML to validate format
-            data = yaml.safe_load(content)
+            data = safe_load_yaml(content)
             if not isinstance(data, dict):
                 return Import(
                     id=import_id,
@@ -344,7 +351,7 @@ class AppDslService:
                     error="Invalid import information",
                 )
             pending_data = PendingData.model_validate_json(pending_data)
-            data = yaml.safe_load(pending_data.yaml_content)
+            data = safe_load_yaml(pending_data.yaml_content)
 
             app = None
             if pending_data.app_id:
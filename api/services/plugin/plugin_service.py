@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Mapping, Sequence
 from mimetypes import guess_type
+from typing import IO
 
 from pydantic import BaseModel
 from yarl import URL
@@ -335,7 +336,7 @@ class PluginService:
         )
 
     @staticmethod
-    def upload_pkg(tenant_id: str, pkg: bytes, verify_signature: bool = False) -> PluginDecodeResponse:
+    def upload_pkg(tenant_id: str, pkg: bytes | IO[bytes], verify_signature: bool = False) -> PluginDecodeResponse:
         """
         Upload plugin package files
 
@@ -379,7 +380,7 @@ class PluginService:
 
     @staticmethod
     def upload_bundle(
-        tenant_id: str, bundle: bytes, verify_signature: bool = False
+        tenant_id: str, bundle: bytes | IO[bytes], verify_signature: bool = False
     ) -> Sequence[PluginBundleDependency]:
         """
         Upload a plugin bundle and return the dependencies.
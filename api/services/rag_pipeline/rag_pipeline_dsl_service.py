@@ -23,6 +23,7 @@ from core.helper import ssrf_proxy
 from core.helper.name_generator import generate_incremental_name
 from core.model_runtime.utils.encoders import jsonable_encoder
 from core.plugin.entities.plugin import PluginDependency
+from core.tools.utils.yaml_utils import safe_load_yaml
 from core.workflow.enums import NodeType
 from core.workflow.nodes.datasource.entities import DatasourceNodeData
 from core.workflow.nodes.knowledge_retrieval.entities import KnowledgeRetrievalNodeData
@@ -185,12 +186,18 @@ class RagPipelineDslService:
                     status=ImportStatus.FAILED,
                     error="yaml_content is required when import_mode is yaml-content",
                 )
+            if len(yaml_content) > DSL_MAX_SIZE:
+                return RagPipelineImportInfo(
+                    id=import_id,
+                    status=ImportStatus.FAILED,
+                    error="File size exceeds the limit of 10MB",
+                )
             content = yaml_content
 
         # Process YAML content
         try:
             # Parse YAML to validate format
-            data = yaml.safe_load(content)
+            data = safe_load_yaml(content)
             if not isinstance(data, dict):
                 return RagPipelineImportInfo(
                     id=import_id,
@@ -395,7 +402,7 @@ class RagPipelineDslService:
                     error="Invalid import information",
                 )
             pending_data = RagPipelinePendingData.model_validate_json(pending_data)
-            data = yaml.safe_load(pending_data.yaml_content)
+            data = safe_load_yaml(pending_data.yaml_content)
 
             pipeline = None
             if pending_data.pipeline_id:
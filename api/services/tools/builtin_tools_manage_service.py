@@ -315,18 +315,18 @@ class BuiltinToolManageService:
     def generate_builtin_tool_provider_name(
         session: Session, tenant_id: str, provider: str, credential_type: CredentialType
     ) -> str:
-        db_providers = (
-            session.query(BuiltinToolProvider)
-            .filter_by(
-                tenant_id=tenant_id,
-                provider=provider,
-                credential_type=credential_type.value,
+        # only the names are needed, so avoid loading full provider rows with their encrypted credentials
+        provider_names = session.scalars(
+            select(BuiltinToolProvider.name)
+            .where(
+                BuiltinToolProvider.tenant_id == tenant_id,
+                BuiltinToolProvider.provider == provider,
+                BuiltinToolProvider.credential_type == credential_type.value,
             )
             .order_by(BuiltinToolProvider.created_at.desc())
-            .all()
-        )
+        ).all()
         return generate_incremental_name(
-            [provider.name for provider in db_providers],
+            provider_names,
             f"{credential_type.get_name()}",
         )
 
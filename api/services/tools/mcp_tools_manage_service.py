@@ -282,10 +282,11 @@ class MCPToolManageService:
         if not mcp_providers:
             return []
 
-        # Batch query all users to avoid N+1 problem
+        # Batch query all user names to avoid N+1 problem; only (id, name) rows are needed, not full accounts
         user_ids = {provider.user_id for provider in mcp_providers}
-        users = self._session.query(Account).where(Account.id.in_(user_ids)).all()
-        user_name_map = {user.id: user.name for user in users}
+        user_name_map = dict(
+            self._session.execute(select(Account.id, Account.name).where(Account.id.in_(user_ids))).tuples().all()
+        )
 
         return [
             ToolTransformService.mcp_provider_to_user_provider(
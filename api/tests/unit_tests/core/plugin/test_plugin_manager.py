@@ -10,6 +10,7 @@ This module tests the plugin management functionality including:
 """
 
 import datetime
+import io
 from unittest.mock import patch
 
 import httpx
@@ -224,6 +225,27 @@ class TestPluginLoading:
             assert call_args[1]["data"]["verify_signature"] == "true"
             assert result.verification.authorized_category == PluginVerification.AuthorizedCategory.Partner
 
+    def test_upload_pkg_from_stream(self, plugin_installer, mock_plugin_declaration):
+        """Test plugin package upload passes a file stream through without reading it."""
+        # Arrange: Wrap package data in a binary stream
+        pkg_stream = io.BytesIO(b"streamed-plugin-package")
+        mock_response = PluginDecodeResponse(
+            unique_identifier="test-org/test-plugin/1.0.0",
+            manifest=mock_plugin_declaration,
+            verification=None,
+        )
+
+        with patch.object(
+            plugin_installer, "_request_with_plugin_daemon_response", return_value=mock_response
+        ) as mock_request:
+            # Act: Upload the stream
+            plugin_installer.upload_pkg("test-tenant", pkg_stream)
+
+            # Assert: The stream itself is handed to the daemon client, unconsumed
+            call_args = mock_request.call_args
+            assert call_args[1]["files"]["dify_pkg"][1] is pkg_stream
+            assert pkg_stream.tell() == 0
+
     def test_install_from_identifiers_success(self, plugin_installer):
         """Test successful plugin installation from identifiers."""
         # Arrange: Mock installation response
@@ -0,0 +1,57 @@
+import pytest
+
+from core.tools.entities.common_entities import I18nObject
+from core.tools.entities.tool_entities import (
+    ToolEntity,
+    ToolIdentity,
+    ToolProviderEntityWithPlugin,
+    ToolProviderIdentity,
+)
+from core.tools.plugin_tool.provider import PluginToolProviderController
+
+
+def _build_controller(tool_names: list[str]) -> PluginToolProviderController:
+    entity = ToolProviderEntityWithPlugin(
+        identity=ToolProviderIdentity(
+            author="test",
+            name="test_provider",
+            description=I18nObject(en_US="test provider"),
+            icon="icon.svg",
+            label=I18nObject(en_US="test provider"),
+        ),
+        tools=[
+            ToolEntity(
+                identity=ToolIdentity(author="test", name=name, label=I18nObject(en_US=name), provider="test_provider")
+            )
+            for name in tool_names
+        ],
+    )
+    return PluginToolProviderController(
+        entity=entity,
+        plugin_id="test/plugin",
+        plugin_unique_identifier="test/plugin:1.0.0",
+        tenant_id="tenant",
+    )
+
+
+def test_get_tool_returns_tool_by_name():
+    controller = _build_controller(["search", "fetch"])
+
+    tool = controller.get_tool("fetch")
+
+    assert tool.entity is controller.entity.tools[1]
+    assert tool.tenant_id == "tenant"
+    assert tool.plugin_unique_identifier == "test/plugin:1.0.0"
+
+
+def test_get_tool_raises_when_tool_missing():
+    controller = _build_controller(["search"])
+
+    with pytest.raises(ValueError, match="Tool with name missing not found"):
+        controller.get_tool("missing")
+
+
+def test_get_tools_preserves_entity_order():
+    controller = _build_controller(["search", "fetch", "summarize"])
+
+    assert [tool.entity.identity.name for tool in controller.get_tools()] == ["search", "fetch", "summarize"]
@@ -12,13 +12,14 @@ This test suite covers:
 import json
 from uuid import uuid4
 
-from core.tools.entities.tool_entities import ApiProviderSchemaType
+from core.tools.entities.tool_entities import ApiProviderSchemaType, ToolParameter
 from models.tools import (
     ApiToolProvider,
     BuiltinToolProvider,
     ToolLabelBinding,
     ToolOAuthSystemClient,
     ToolOAuthTenantClient,
+    WorkflowToolProvider,
 )
 
 
@@ -490,6 +491,37 @@ class TestApiToolProviderValidation:
         assert api_provider.credentials["api_key_query_param"] == "apikey"
 
 
+class TestWorkflowToolProviderValidation:
+    """Test suite for WorkflowToolProvider model validation and operations."""
+
+    def test_workflow_tool_provider_parameter_configurations_property(self):
+        """Test parameter_configurations property parses JSON into configuration entities."""
+        # Arrange
+        configurations = [
+            {"name": "query", "description": "Search query", "form": "llm"},
+            {"name": "limit", "description": "Result limit", "form": "form"},
+        ]
+        workflow_provider = WorkflowToolProvider(
+            name="search_workflow",
+            label="Search Workflow",
+            icon="{}",
+            app_id=str(uuid4()),
+            version="1",
+            user_id=str(uuid4()),
+            tenant_id=str(uuid4()),
+            description="Search workflow tool",
+            parameter_configuration=json.dumps(configurations),
+        )
+
+        # Act
+        result = workflow_provider.parameter_configurations
+
+        # Assert
+        assert [config.name for config in result] == ["query", "limit"]
+        assert result[0].form == ToolParameter.ToolParameterForm.LLM
+        assert result[1].form == ToolParameter.ToolParameterForm.FORM
+
+
 class TestToolOAuthModels:
     """Test suite for OAuth client models (system and tenant level)."""
 
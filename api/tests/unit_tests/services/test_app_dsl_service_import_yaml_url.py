@@ -69,3 +69,22 @@ def test_import_app_yaml_url_github_blob_rewrites_to_raw(monkeypatch):
 
     assert result.status == ImportStatus.PENDING
     assert requested_urls == [raw_url]
+
+
+def test_import_app_yaml_content_exceeding_limit_fails_before_parsing(monkeypatch):
+    monkeypatch.setattr(app_dsl_service, "DSL_MAX_SIZE", 16)
+
+    def fail_if_parsed(content):
+        raise AssertionError("oversized DSL content must not be parsed")
+
+    monkeypatch.setattr(app_dsl_service, "safe_load_yaml", fail_if_parsed)
+
+    service = AppDslService(MagicMock())
+    result = service.import_app(
+        account=_account_mock(),
+        import_mode=ImportMode.YAML_CONTENT,
+        yaml_content=_pending_yaml_content().decode(),
+    )
+
+    assert result.status == ImportStatus.FAILED
+    assert result.error == "File size exceeds the limit of 10MB"
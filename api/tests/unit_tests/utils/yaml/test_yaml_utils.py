@@ -1,9 +1,10 @@
 from textwrap import dedent
 
 import pytest
+import yaml
 from yaml import YAMLError
 
-from core.tools.utils.yaml_utils import _load_yaml_file
+from core.tools.utils.yaml_utils import _load_yaml_file, safe_load_yaml
 
 EXAMPLE_YAML_FILE = "example_yaml.yaml"
 INVALID_YAML_FILE = "invalid_yaml.yaml"
@@ -78,3 +79,32 @@ def test_load_invalid_yaml_file(prepare_invalid_yaml_file):
     # yaml syntax error
     with pytest.raises(YAMLError):
         _load_yaml_file(file_path=prepare_invalid_yaml_file)
+
+
+def test_load_yaml_file_matches_pure_python_loader(prepare_example_yaml_file):
+    with open(prepare_example_yaml_file, encoding="utf-8") as f:
+        expected = yaml.load(f, Loader=yaml.SafeLoader)
+
+    assert _load_yaml_file(file_path=prepare_example_yaml_file) == expected
+
+
+def test_safe_load_yaml_matches_yaml_safe_load():
+    content = dedent(
+        """\
+        app:
+          name: Example
+          mode: workflow
+        workflow:
+          graph:
+            nodes:
+              - id: start
+                data: {type: start, title: Start}
+        """
+    )
+
+    assert safe_load_yaml(content) == yaml.safe_load(content)
+
+
+def test_safe_load_yaml_rejects_python_tags():
+    with pytest.raises(YAMLError):
+        safe_load_yaml("!!python/object/apply:os.system ['echo unsafe']")